@@ -1,6 +1,18 @@
 import re
 import os
-from openai import OpenAI
+import io
+import json
+import time
+import hashlib
+from pathlib import Path
+import heapq
+import asyncio
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+import tiktoken
+from openai import (OpenAI, AsyncOpenAI, RateLimitError,
+                    APIConnectionError, InternalServerError)
 
 # ---------------------- CONFIG ----------------------
 MIC_FILE = "Mic_transcript.txt"
@@ -8,28 +20,42 @@ SPK_FILE = "Speaker_transcript.txt"
 OUT_FILE = "Combined_transcript.txt"
 SUMMARY_FILE = "Meeting_summary.txt"
 
-client = OpenAI()   # Uses OPENAI_API_KEY from environment
+client = OpenAI()          # Uses OPENAI_API_KEY from environment
+async_client = AsyncOpenAI()
+
+# Transcripts above this many tokens are summarized chunk-by-chunk
+# and then reduced, instead of being sent as one giant prompt
+MAX_PROMPT_TOKENS = 8000
+CHUNK_TOKENS = 6000
+
+# Summaries are cached by transcript hash so reruns over an unchanged
+# transcript don't pay for a second API call
+CACHE_DIR = Path.home() / ".cache" / "octi"
+
+# One lean record per parsed line instead of a 6-key dict.
+# label_id keeps the sort key all-numeric; LABELS maps back for output.
+Segment = namedtuple("Segment", "start_sec end_sec text label_id")
+LABELS = ("MIC", "SPEAKER")
+
+# Compiled once at import. One alternation handles both HH:MM:SS.mmm (mic)
+# and MM:SS.mm (speaker) timestamps. The numeric parts are captured
+# directly, so seconds are computed from the match groups without
+# re-splitting the string.
+_PAT = re.compile(
+    r"^\[(?:(\d{2}):)?(\d{2}):(\d{2})\.(\d+)"
+    r"\s*→\s*"
+    r"(?:(\d{2}):)?(\d{2}):(\d{2})\.(\d+)\]\s*(.*)",
+    re.MULTILINE
+)
+
+# Transcripts up to this size are read whole and scanned with one
+# finditer pass; anything bigger falls back to line streaming
+_SLURP_LIMIT = 256 * 1024 * 1024
 
 # -------------------------------------------------------
-# Convert timestamp → seconds
+# Convert seconds → MM:SS.ms
 # -------------------------------------------------------
-def to_seconds(ts):
-    if ts.count(":") == 2:   # HH:MM:SS.mmm
-        h, m, s = ts.split(":")
-        return int(h) * 3600 + int(m) * 60 + float(s)
-
-    if ts.count(":") == 1:   # MM:SS.mm
-        m, s = ts.split(":")
-        return int(m) * 60 + float(s)
-
-    return 0.0
-
-
-# -------------------------------------------------------
-# Convert ANY timestamp → MM:SS.ms
-# -------------------------------------------------------
-def to_mmss(ts):
-    sec = to_seconds(ts)
+def to_mmss(sec):
     m = int(sec // 60)
     s = sec % 60
     return f"{m:02d}:{s:05.2f}"
@@ -38,45 +64,39 @@ def to_mmss(ts):
 # -------------------------------------------------------
 # Parse a transcript file
 # -------------------------------------------------------
-def parse_file(path, label):
-    segments = []
-
-    p1 = re.compile(
-        r"\[(\d{2}:\d{2}:\d{2}\.\d+)\s*→\s*(\d{2}:\d{2}:\d{2}\.\d+)\]\s*(.*)"
+def _segment(m, label_id):
+    h1, m1, s1, f1, h2, m2, s2, f2, text = m.groups()
+    return Segment(
+        (int(h1) if h1 else 0) * 3600 + int(m1) * 60
+        + int(s1) + int(f1) / 10 ** len(f1),
+        (int(h2) if h2 else 0) * 3600 + int(m2) * 60
+        + int(s2) + int(f2) / 10 ** len(f2),
+        text.rstrip(),
+        label_id
     )
 
-    p2 = re.compile(
-        r"\[(\d{2}:\d{2}\.\d+)\s*→\s*(\d{2}:\d{2}\.\d+)\]\s*(.*)"
-    )
 
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f.readlines():
-            line = line.strip()
+def parse_file(path, label_id):
+    # Normal case: read the whole file and let finditer scan it in one
+    # C-level pass — no per-line Python loop at all
+    if os.path.getsize(path) <= _SLURP_LIMIT:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        return [_segment(m, label_id) for m in _PAT.finditer(text)]
 
-            m = p1.search(line)
-            if m:
-                start, end, text = m.groups()
-                segments.append({
-                    "start": start,
-                    "end": end,
-                    "start_sec": to_seconds(start),
-                    "end_sec": to_seconds(end),
-                    "text": text,
-                    "label": label
-                })
+    # Streaming fallback for very large transcripts
+    segments = []
+    with open(path, "r", encoding="utf-8", buffering=65536) as f:
+        for line in f:
+            # One-byte prefilter: blank lines and prose never reach the
+            # regex engine at all. No strip() — that allocated a new
+            # string per line just to drop the trailing newline.
+            if not line or line[0] != "[":
                 continue
 
-            m = p2.search(line)
+            m = _PAT.match(line)
             if m:
-                start, end, text = m.groups()
-                segments.append({
-                    "start": start,
-                    "end": end,
-                    "start_sec": to_seconds(start),
-                    "end_sec": to_seconds(end),
-                    "text": text,
-                    "label": label
-                })
+                segments.append(_segment(m, label_id))
 
     return segments
 
@@ -84,8 +104,8 @@ def parse_file(path, label):
 # -------------------------------------------------------
 # Call ChatGPT to generate summary + title
 # -------------------------------------------------------
-def generate_summary(transcript_text):
-    prompt = f"""
+def _build_prompt(transcript_text):
+    return f"""
 You are an AI meeting assistant.
 
 Below is the full meeting transcript.
@@ -99,14 +119,188 @@ Transcript:
 {transcript_text}
 """
 
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",    # You can change this
-        messages=[{"role": "user", "content": prompt}]
-    )
 
+def generate_summary(transcript_text, out_path=None):
+    prompt = _build_prompt(transcript_text)
+
+    def _create_stream():
+        # Stream the completion so tokens hit the disk as they arrive
+        # instead of blocking on the full response. max_tokens caps a
+        # 5-10 bullet summary; low temperature keeps it focused.
+        return client.chat.completions.create(
+            model="gpt-4o-mini",    # You can change this
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=400,
+            temperature=0.2,
+            timeout=60,
+            stream=True
+        )
+
+    tmp_path = out_path + ".tmp" if out_path else None
+
+    def _attempt():
+        # One complete call: the handshake plus draining the stream.
+        # With stream=True the request returns almost immediately and
+        # nearly all of the call's lifetime — where connection errors
+        # actually happen — is the iteration below, so it has to live
+        # inside the retry too.
+        stream = _create_stream()
+        pieces = []
+        # Stream into a temp name and rename only once the stream
+        # finished cleanly — a mid-stream failure must not leave a
+        # truncated summary that the launcher's exists() check mistakes
+        # for a finished one. Same contract as the combined-transcript
+        # write in merge_transcripts.
+        out = open(tmp_path, "w", encoding="utf-8") if tmp_path else None
+        try:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    pieces.append(delta)
+                    if out:
+                        out.write(delta)
+        except BaseException:
+            if out:
+                out.close()
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            raise
+        if out:
+            out.close()
+            os.replace(tmp_path, out_path)
+
+        return "".join(pieces)
+
+    # Exponential backoff on transient errors only: rate limits,
+    # connection drops/timeouts and 5xx. Anything else (bad key,
+    # context length, ...) won't get better on retry — let it raise.
+    for delay in (1, 2, 4, 8):
+        try:
+            return _attempt()
+        except (RateLimitError, APIConnectionError, InternalServerError) as e:
+            print(f"⚠ OpenAI call failed ({e.__class__.__name__}), retrying in {delay}s...")
+            time.sleep(delay)
+    return _attempt()   # last attempt, let errors propagate
+
+
+# -------------------------------------------------------
+# Map-reduce summary for very long transcripts
+# -------------------------------------------------------
+def _split_by_tokens(text):
+    """Split transcript text into ~CHUNK_TOKENS windows on line boundaries."""
+    enc = tiktoken.encoding_for_model("gpt-4o-mini")
+
+    chunks = []
+    cur, cur_tokens = [], 0
+    for line in text.splitlines(keepends=True):
+        n = len(enc.encode(line))
+        if cur and cur_tokens + n > CHUNK_TOKENS:
+            chunks.append("".join(cur))
+            cur, cur_tokens = [], 0
+        cur.append(line)
+        cur_tokens += n
+    if cur:
+        chunks.append("".join(cur))
+
+    return chunks
+
+
+async def _summarize_chunk(idx, total, chunk):
+    response = await async_client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{
+            "role": "user",
+            "content": (
+                f"Below is part {idx} of {total} of a meeting transcript.\n"
+                "Summarize it in 5 concise bullet points.\n\n"
+                f"{chunk}"
+            ),
+        }],
+        max_tokens=400,
+        temperature=0.2,
+        timeout=60
+    )
     return response.choices[0].message.content
 
 
+def summarize_long(transcript_text, out_path=None):
+    """Chunk → summarize each chunk concurrently → reduce to one summary."""
+    chunks = _split_by_tokens(transcript_text)
+    print(f"📡 Long transcript: summarizing {len(chunks)} chunks...")
+
+    async def _run():
+        return await asyncio.gather(*(
+            _summarize_chunk(i + 1, len(chunks), c)
+            for i, c in enumerate(chunks)
+        ))
+
+    partials = asyncio.run(_run())
+
+    combined = "\n\n".join(
+        f"Part {i + 1}:\n{p}" for i, p in enumerate(partials)
+    )
+
+    # Reduce step reuses the normal prompt + streaming path
+    return generate_summary(combined, out_path=out_path)
+
+
+# -------------------------------------------------------
+# Summarize many transcripts in one Batch API job
+# (50% cheaper than synchronous calls; use this when
+#  processing a backlog of meetings instead of calling
+#  generate_summary once per meeting)
+# -------------------------------------------------------
+def summarize_many(transcripts):
+    """transcripts: list of (meeting_id, transcript_text).
+
+    Returns {meeting_id: summary_text}.
+    """
+    lines = []
+    for meeting_id, text in transcripts:
+        lines.append(json.dumps({
+            "custom_id": str(meeting_id),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": "gpt-4o-mini",
+                "messages": [{"role": "user", "content": _build_prompt(text)}],
+            },
+        }))
+
+    batch_file = client.files.create(
+        file=io.BytesIO("\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    print(f"📡 Batch {batch.id} submitted ({len(transcripts)} meetings)...")
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(30)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status: {batch.status}")
+
+    summaries = {}
+    output = client.files.content(batch.output_file_id)
+    for line in output.text.splitlines():
+        if not line:
+            continue
+        item = json.loads(line)
+        body = item["response"]["body"]
+        summaries[item["custom_id"]] = body["choices"][0]["message"]["content"]
+
+    return summaries
+
+
 # -------------------------------------------------------
 # Merge transcripts + produce summary
 # -------------------------------------------------------
@@ -115,22 +309,32 @@ def merge_transcripts():
         print("❌ Transcript files missing")
         return
 
-    mic = parse_file(MIC_FILE, "MIC")
-    spk = parse_file(SPK_FILE, "SPEAKER")
-
-    combined = mic + spk
-
-    combined.sort(key=lambda x: (x["start_sec"], x["end_sec"], x["label"]))
-
-    # Write combined transcript
-    with open(OUT_FILE, "w", encoding="utf-8") as f:
-        for seg in combined:
-            f.write(
-                f"[{to_mmss(seg['start'])} → {to_mmss(seg['end'])}] "
-                f"({seg['label']}) {seg['text']}\n"
-            )
-
-    # Delete original split files
+    # The two files are independent; parse them in parallel so disk
+    # reads and regex work overlap
+    with ThreadPoolExecutor(2) as ex:
+        mic_fut = ex.submit(parse_file, MIC_FILE, 0)
+        spk_fut = ex.submit(parse_file, SPK_FILE, 1)
+        mic, spk = mic_fut.result(), spk_fut.result()
+
+    # Each file is already in time order, so a linear merge of the two
+    # sorted lists replaces concat + full sort and streams straight to disk.
+    key = operator.attrgetter("start_sec", "end_sec", "label_id")
+
+    # Write combined transcript in one buffered writelines call.
+    # Write to a temp name and rename atomically: a crash mid-write
+    # must not leave a partial output while the inputs get deleted,
+    # or the whole meeting would need re-transcription.
+    tmp_file = OUT_FILE + ".tmp"
+    fmt = "[{} → {}] ({}) {}\n".format   # bound once, not rebuilt per line
+    with open(tmp_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(
+            fmt(to_mmss(seg.start_sec), to_mmss(seg.end_sec),
+                LABELS[seg.label_id], seg.text)
+            for seg in heapq.merge(mic, spk, key=key)
+        )
+    os.replace(tmp_file, OUT_FILE)
+
+    # Delete original split files only once the output is in place
     os.remove(MIC_FILE)
     os.remove(SPK_FILE)
 
@@ -144,11 +348,25 @@ def merge_transcripts():
     with open(OUT_FILE, "r", encoding="utf-8") as f:
         text = f.read()
 
-    summary_text = generate_summary(text)
-
-    # Save summary to file
-    with open(SUMMARY_FILE, "w", encoding="utf-8") as f:
-        f.write(summary_text)
+    # Reruns over an unchanged transcript hit the local cache for free
+    cache_path = CACHE_DIR / (
+        hashlib.sha256(text.encode("utf-8")).hexdigest() + ".txt"
+    )
+    if cache_path.exists():
+        print("✅ Using cached summary")
+        with open(SUMMARY_FILE, "w", encoding="utf-8") as f:
+            f.write(cache_path.read_text(encoding="utf-8"))
+    else:
+        # Summary is streamed straight into the file as tokens arrive;
+        # very long transcripts go through the map-reduce path instead
+        enc = tiktoken.encoding_for_model("gpt-4o-mini")
+        if len(enc.encode(text)) > MAX_PROMPT_TOKENS:
+            summary_text = summarize_long(text, out_path=SUMMARY_FILE)
+        else:
+            summary_text = generate_summary(text, out_path=SUMMARY_FILE)
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(summary_text, encoding="utf-8")
 
     print("✅ Meeting summary saved to:", SUMMARY_FILE)
 
@@ -1,854 +1,1334 @@
-"""
-OCTI Meeting Launcher - Windows Orchestrator
-Automatically detects meetings and manages transcription scripts.
-Small circular bubble UI with octopus logo.
-"""
-
-import subprocess
-import psutil
-import time
-import os
-import sys
-import signal
-import threading
-import tkinter as tk
-from tkinter import ttk, messagebox
-from PIL import Image, ImageTk  # pip install pillow
-
-# Configuration
-MEETING_APPS = {
-    "Zoom": ["Zoom.exe", "CptHost.exe"],
-    "Teams": ["ms-teams.exe", "Teams.exe"],
-    "Google Meet": ["chrome.exe", "msedge.exe", "firefox.exe"],
-}
-
-SCRIPT_PATHS = {
-    "mic": "octiMic.py",
-    "speaker": "octiSpeaker.py",
-    "combined": "octiCombined.py"
-}
-
-LOGO_FILE = "octopus_logo.png"
-
-# Bubble config
-BUBBLE_SIZE = 70        # small bubble
-BORDER_WIDTH = 6        # thick outer ring
-
-# Global state
-recording_processes = {}
-is_recording = False
-root = None
-status_label = None   # kept for compatibility with your logic
-button = None         # kept for compatibility with your logic
-
-# bubble drawing state
-canvas = None
-border_circle_id = None
-logo_img = None
-drag_offset_x = 0
-drag_offset_y = 0
-
-
-def check_meeting_running():
-    """Check if any meeting app is running."""
-    running_processes = {p.name().lower(): p for p in psutil.process_iter(['name'])}
-    
-    for app_name, process_names in MEETING_APPS.items():
-        for proc_name in process_names:
-            if proc_name.lower() in running_processes:
-                # keep your original behavior: skip raw browser
-                if proc_name.lower() in ["chrome.exe", "msedge.exe", "firefox.exe"]:
-                    continue
-                return app_name
-    
-    return None
-
-
-# --------- Bubble helpers (pure UI) --------- #
-
-def set_border_color(color: str):
-    """Change the outer ring color of the bubble."""
-    global canvas, border_circle_id
-    if canvas is not None and border_circle_id is not None:
-        canvas.itemconfig(border_circle_id, outline=color)
-
-
-def show_bubble():
-    if root:
-        root.deiconify()
-        root.attributes("-alpha", 0.98)
-
-
-def hide_bubble():
-    if root:
-        root.withdraw()
-
-
-def on_bubble_press(event):
-    """For dragging."""
-    global drag_offset_x, drag_offset_y
-    drag_offset_x = event.x
-    drag_offset_y = event.y
-
-
-def on_bubble_drag(event):
-    """Drag bubble around screen."""
-    x = event.x_root - drag_offset_x
-    y = event.y_root - drag_offset_y
-    root.geometry(f"{BUBBLE_SIZE}x{BUBBLE_SIZE}+{x}+{y}")
-
-
-def on_bubble_click(event):
-    """Left-click: toggle start/stop using your existing functions."""
-    global is_recording
-    if not is_recording:
-        start_recording()
-    else:
-        stop_recording()
-
-
-# --------- ORIGINAL LOGIC (UNCHANGED except border color calls) --------- #
-
-def start_recording():
-    """Start all recording scripts."""
-    global recording_processes, is_recording
-    
-    if is_recording:
-        return
-    
-    # Verify scripts exist
-    script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
-    for script_type, script_path in SCRIPT_PATHS.items():
-        full_path = os.path.join(script_dir, script_path)
-        if not os.path.exists(full_path):
-            messagebox.showerror("Error", f"Script not found: {full_path}")
-            return
-    
-    is_recording = True
-    recording_processes = {}
-    
-    try:
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-        
-        # Start mic script
-        mic_path = os.path.join(script_dir, SCRIPT_PATHS["mic"])
-        print(f"Starting mic: {mic_path}")
-        mic_proc = subprocess.Popen(
-            [sys.executable, mic_path],
-            stdout=subprocess.DEVNULL,  # Don't capture - let it run freely
-            stderr=subprocess.DEVNULL,
-            env=env,
-            cwd=script_dir
-        )
-        recording_processes["mic"] = mic_proc
-        
-        # Start speaker script
-        speaker_path = os.path.join(script_dir, SCRIPT_PATHS["speaker"])
-        print(f"Starting speaker: {speaker_path}")
-        speaker_proc = subprocess.Popen(
-            [sys.executable, speaker_path],
-            stdout=subprocess.DEVNULL,  # Don't capture - let it run freely
-            stderr=subprocess.DEVNULL,
-            env=env,
-            cwd=script_dir
-        )
-        recording_processes["speaker"] = speaker_proc
-        
-        # Wait a moment to check if they started
-        time.sleep(2)
-        
-        # Check if processes are still running
-        if mic_proc.poll() is not None:
-            print(f"Mic script exited immediately with code {mic_proc.returncode}")
-            messagebox.showerror("Error", f"Mic script failed to start (exit code {mic_proc.returncode})")
-            if speaker_proc.poll() is None:
-                speaker_proc.terminate()
-            is_recording = False
-            recording_processes = {}
-            set_border_color("gray")
-            return
-        
-        if speaker_proc.poll() is not None:
-            print(f"Speaker script exited immediately with code {speaker_proc.returncode}")
-            messagebox.showerror("Error", f"Speaker script failed to start (exit code {speaker_proc.returncode})")
-            if mic_proc.poll() is None:
-                mic_proc.terminate()
-            is_recording = False
-            recording_processes = {}
-            set_border_color("gray")
-            return
-        
-        update_status("🟢 Recording...", "green")
-        set_border_color("#00C851")  # bright green ring
-        # button is invisible, but keep behaviour so logic untouched
-        if button:
-            button.config(text="⏹ Stop Recording", command=stop_recording)
-        
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to start: {e}")
-        is_recording = False
-        recording_processes = {}
-        set_border_color("gray")
-
-
-def stop_recording():
-    """Stop all recording scripts and process."""
-    global recording_processes, is_recording
-    
-    if not is_recording:
-        return
-    
-    script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
-    
-    update_status("⏸ Stopping...", "orange")
-    set_border_color("#ff4444")  # red while stopping/processing
-    if button:
-        button.config(state="disabled")
-    if root:
-        root.update()
-    
-    # Stop processes - send SIGINT (KeyboardInterrupt) so they can save files
-    for name, proc in recording_processes.items():
-        if proc and proc.poll() is None:
-            try:
-                if sys.platform == "win32":
-                    # On Windows, try to send CTRL_C_EVENT (KeyboardInterrupt)
-                    try:
-                        proc.send_signal(signal.CTRL_C_EVENT)
-                    except:
-                        # If that fails, use terminate
-                        proc.terminate()
-                else:
-                    # On Unix, send SIGINT (KeyboardInterrupt)
-                    proc.send_signal(signal.SIGINT)
-            except Exception as e:
-                print(f"Error sending signal to {name}: {e}")
-                # Fallback to terminate
-                try:
-                    proc.terminate()
-                except:
-                    pass
-    
-    # Wait for processes to finish (give them time to process and save)
-    print("Waiting for processes to finish...")
-    for name, proc in list(recording_processes.items()):
-        if proc:
-            try:
-                # Give them time to catch KeyboardInterrupt and process
-                proc.wait(timeout=180)  # 3 minutes max
-                print(f"{name} finished with code {proc.returncode}")
-            except subprocess.TimeoutExpired:
-                print(f"{name} timed out, killing...")
-                proc.kill()
-                proc.wait()
-            except Exception as e:
-                print(f"Error waiting for {name}: {e}")
-    
-    recording_processes = {}
-    is_recording = False
-    
-    # Wait for files to be created
-    update_status("⏳ Processing...", "blue")
-    if root:
-        root.update()
-    
-    mic_file = os.path.join(script_dir, "Mic_transcript.txt")
-    spk_file = os.path.join(script_dir, "Speaker_transcript.txt")
-    
-    # Wait up to 120 seconds for files (transcription can take time)
-    print("Waiting for transcript files...")
-    for i in range(60):  # 60 * 2 = 120 seconds
-        time.sleep(2)
-        mic_exists = os.path.exists(mic_file)
-        spk_exists = os.path.exists(spk_file)
-        if mic_exists and spk_exists:
-            print("Both transcript files found!")
-            break
-        if i % 5 == 0:  # Print status every 10 seconds
-            print(f"Waiting... Mic: {mic_exists}, Speaker: {spk_exists}")
-        if root:
-            root.update()
-    
-    # Check if files exist
-    if not os.path.exists(mic_file) or not os.path.exists(spk_file):
-        missing = []
-        if not os.path.exists(mic_file):
-            missing.append("Mic_transcript.txt")
-        if not os.path.exists(spk_file):
-            missing.append("Speaker_transcript.txt")
-        messagebox.showerror(
-            "Error",
-            f"Missing files:\n" + "\n".join(missing) + "\n\nCheck if recording captured audio."
-        )
-        update_status("❌ Failed", "red")
-        set_border_color("gray")
-        if button:
-            button.config(text="▶ Start Recording", command=start_recording, state="normal")
-        return
-    
-    # Run combined script
-    update_status("🔄 Merging...", "blue")
-    if root:
-        root.update()
-    
-    try:
-        combined_path = os.path.join(script_dir, SCRIPT_PATHS["combined"])
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-        
-        combined_proc = subprocess.Popen(
-            [sys.executable, combined_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            env=env,
-            cwd=script_dir
-        )
-        
-        stdout, stderr = combined_proc.communicate(timeout=300)
-        
-        if combined_proc.returncode != 0:
-            print(f"Combined script error: {stderr[:500]}")
-    except Exception as e:
-        print(f"Error running combined script: {e}")
-    
-    # Check results
-    summary_file = os.path.join(script_dir, "Meeting_summary.txt")
-    combined_file = os.path.join(script_dir, "Combined_transcript.txt")
-    
-    if os.path.exists(summary_file) and os.path.exists(combined_file):
-        update_status("✅ Complete!", "green")
-        messagebox.showinfo(
-            "Complete",
-            "Files created:\n- Combined_transcript.txt\n- Meeting_summary.txt"
-        )
-    else:
-        update_status("⚠️ Partial", "orange")
-        messagebox.showwarning(
-            "Warning",
-            f"Combined: {'✓' if os.path.exists(combined_file) else '✗'}\n"
-            f"Summary: {'✓' if os.path.exists(summary_file) else '✗'}"
-        )
-    
-    if button:
-        button.config(text="▶ Start Recording", command=start_recording, state="normal")
-
-    # after everything, hide bubble
-    if root:
-        root.after(1000, hide_bubble)
-
-
-def update_status(text, color="black"):
-    """Update status label (still exists but not shown visually)."""
-    if status_label:
-        status_label.config(text=text, fg=color)
-    # Also print to console for debugging
-    print(text)
-
-
-def monitor_meetings():
-    """Background thread to monitor for meeting apps."""
-    meeting_detected = False
-    
-    while True:
-        meeting_app = check_meeting_running()
-        
-        if meeting_app and not meeting_detected:
-            meeting_detected = True
-            if root:
-                root.after(0, lambda: update_status(f"📹 {meeting_app} detected", "blue"))
-                root.after(0, show_bubble)
-        
-        elif not meeting_app and meeting_detected:
-            meeting_detected = False
-            if root and not is_recording:
-                root.after(0, lambda: update_status("⏸ No meeting", "gray"))
-                root.after(0, hide_bubble)
-        
-        time.sleep(2)
-
-
-def create_gui():
-    """Create the small circular bubble window."""
-    global root, status_label, button, canvas, border_circle_id, logo_img
-    
-    root = tk.Tk()
-    root.title("OCTI Meeting Recorder")
-    
-    # Small borderless always-on-top window
-    root.geometry(f"{BUBBLE_SIZE}x{BUBBLE_SIZE}")
-    root.overrideredirect(True)
-    root.attributes("-topmost", True)
-
-    # Make window background transparent except bubble
-    TRANSPARENT_COLOR = "#ff00ff"
-    root.config(bg=TRANSPARENT_COLOR)
-    root.wm_attributes("-transparentcolor", TRANSPARENT_COLOR)
-    
-    # Position near top-right
-    root.update_idletasks()
-    screen_w = root.winfo_screenwidth()
-    x = screen_w - BUBBLE_SIZE - 40
-    y = 80
-    root.geometry(f"{BUBBLE_SIZE}x{BUBBLE_SIZE}+{x}+{y}")
-    
-    # Canvas for bubble
-    canvas = tk.Canvas(
-        root,
-        width=BUBBLE_SIZE,
-        height=BUBBLE_SIZE,
-        highlightthickness=0,
-        bg=TRANSPARENT_COLOR
-    )
-    canvas.pack(fill="both", expand=True)
-    
-    # Draw white circle with colored border (initially gray)
-    padding = 4
-    border_circle_id = canvas.create_oval(
-        padding,
-        padding,
-        BUBBLE_SIZE - padding,
-        BUBBLE_SIZE - padding,
-        outline="gray",
-        width=BORDER_WIDTH,
-        fill="white"
-    )
-    
-    # Load and scale logo
-    script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
-    logo_path = os.path.join(script_dir, LOGO_FILE)
-    try:
-        img = Image.open(logo_path).convert("RGBA")
-        # scale to fit inside circle (60% of bubble)
-        target = int(BUBBLE_SIZE * 0.55)
-        img.thumbnail((target, target), Image.LANCZOS)
-        logo_img = ImageTk.PhotoImage(img)
-        canvas.create_image(
-            BUBBLE_SIZE // 2,
-            BUBBLE_SIZE // 2,
-            image=logo_img
-        )
-    except Exception as e:
-        print("Logo load error:", e)
-    
-    # Invisible label & button (for compatibility with your existing logic)
-    status_label = tk.Label(root)
-    button = tk.Button(root)
-    # not packing them => they never show
-    
-    # Mouse bindings
-    canvas.bind("<ButtonPress-1>", on_bubble_press)
-    canvas.bind("<B1-Motion>", on_bubble_drag)
-    canvas.bind("<ButtonRelease-1>", on_bubble_click)
-    
-    # Start monitoring thread
-    monitor_thread = threading.Thread(target=monitor_meetings, daemon=True)
-    monitor_thread.start()
-    
-    # Start hidden until meeting is detected
-    hide_bubble()
-    root.mainloop()
-
-
-if __name__ == "__main__":
-    try:
-        import psutil  # ensure installed
-    except ImportError:
-        print("Error: psutil not installed. Install it with: pip install psutil")
-        sys.exit(1)
-    
-    script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
-    missing = [path for path in SCRIPT_PATHS.values() 
-               if not os.path.exists(os.path.join(script_dir, path))]
-    if missing:
-        print(f"Error: Missing scripts: {', '.join(missing)}")
-        sys.exit(1)
-    
-    print("Starting OCTI Meeting Launcher...")
-    create_gui()
-
-
-#_______________________________________________________Older Version______________________________________________________________________________________________
-# #!/usr/bin/env python3
-# """
-# OCTI Meeting Launcher - Windows Orchestrator
-# Automatically detects meetings and manages transcription scripts.
-# """
-
-# import subprocess
-# import psutil
-# import time
-# import os
-# import sys
-# import signal
-# import threading
-# import tkinter as tk
-# from tkinter import ttk, messagebox
-
-# # Configuration
-# MEETING_APPS = {
-#     "Zoom": ["Zoom.exe", "CptHost.exe"],
-#     "Teams": ["ms-teams.exe", "Teams.exe"],
-#     "Google Meet": ["chrome.exe", "msedge.exe", "firefox.exe"],
-# }
-
-# SCRIPT_PATHS = {
-#     "mic": "octiMic.py",
-#     "speaker": "octiSpeaker.py",
-#     "combined": "octiCombined.py"
-# }
-
-# # Global state
-# recording_processes = {}
-# is_recording = False
-# root = None
-# status_label = None
-# button = None
-
-
-# def check_meeting_running():
-#     """Check if any meeting app is running."""
-#     running_processes = {p.name().lower(): p for p in psutil.process_iter(['name'])}
-    
-#     for app_name, process_names in MEETING_APPS.items():
-#         for proc_name in process_names:
-#             if proc_name.lower() in running_processes:
-#                 if proc_name.lower() in ["chrome.exe", "msedge.exe", "firefox.exe"]:
-#                     continue
-#                 return app_name
-    
-#     return None
-
-
-# def start_recording():
-#     """Start all recording scripts."""
-#     global recording_processes, is_recording
-    
-#     if is_recording:
-#         return
-    
-#     # Verify scripts exist
-#     script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
-#     for script_type, script_path in SCRIPT_PATHS.items():
-#         full_path = os.path.join(script_dir, script_path)
-#         if not os.path.exists(full_path):
-#             messagebox.showerror("Error", f"Script not found: {full_path}")
-#             return
-    
-#     is_recording = True
-#     recording_processes = {}
-    
-#     try:
-#         env = os.environ.copy()
-#         env['PYTHONIOENCODING'] = 'utf-8'
-        
-#         # Start mic script
-#         mic_path = os.path.join(script_dir, SCRIPT_PATHS["mic"])
-#         print(f"Starting mic: {mic_path}")
-#         mic_proc = subprocess.Popen(
-#             [sys.executable, mic_path],
-#             stdout=subprocess.DEVNULL,  # Don't capture - let it run freely
-#             stderr=subprocess.DEVNULL,
-#             env=env,
-#             cwd=script_dir
-#         )
-#         recording_processes["mic"] = mic_proc
-        
-#         # Start speaker script
-#         speaker_path = os.path.join(script_dir, SCRIPT_PATHS["speaker"])
-#         print(f"Starting speaker: {speaker_path}")
-#         speaker_proc = subprocess.Popen(
-#             [sys.executable, speaker_path],
-#             stdout=subprocess.DEVNULL,  # Don't capture - let it run freely
-#             stderr=subprocess.DEVNULL,
-#             env=env,
-#             cwd=script_dir
-#         )
-#         recording_processes["speaker"] = speaker_proc
-        
-#         # Wait a moment to check if they started
-#         time.sleep(2)
-        
-#         # Check if processes are still running
-#         if mic_proc.poll() is not None:
-#             print(f"Mic script exited immediately with code {mic_proc.returncode}")
-#             messagebox.showerror("Error", f"Mic script failed to start (exit code {mic_proc.returncode})")
-#             if speaker_proc.poll() is None:
-#                 speaker_proc.terminate()
-#             is_recording = False
-#             recording_processes = {}
-#             return
-        
-#         if speaker_proc.poll() is not None:
-#             print(f"Speaker script exited immediately with code {speaker_proc.returncode}")
-#             messagebox.showerror("Error", f"Speaker script failed to start (exit code {speaker_proc.returncode})")
-#             if mic_proc.poll() is None:
-#                 mic_proc.terminate()
-#             is_recording = False
-#             recording_processes = {}
-#             return
-        
-#         update_status("🟢 Recording...", "green")
-#         button.config(text="⏹ Stop Recording", command=stop_recording)
-        
-#     except Exception as e:
-#         messagebox.showerror("Error", f"Failed to start: {e}")
-#         is_recording = False
-#         recording_processes = {}
-
-
-# def stop_recording():
-#     """Stop all recording scripts and process."""
-#     global recording_processes, is_recording
-    
-#     if not is_recording:
-#         return
-    
-#     script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
-    
-#     update_status("⏸ Stopping...", "orange")
-#     button.config(state="disabled")
-#     root.update()
-    
-#     # Stop processes - send SIGINT (KeyboardInterrupt) so they can save files
-#     for name, proc in recording_processes.items():
-#         if proc and proc.poll() is None:
-#             try:
-#                 if sys.platform == "win32":
-#                     # On Windows, try to send CTRL_C_EVENT (KeyboardInterrupt)
-#                     try:
-#                         proc.send_signal(signal.CTRL_C_EVENT)
-#                     except:
-#                         # If that fails, use terminate
-#                         proc.terminate()
-#                 else:
-#                     # On Unix, send SIGINT (KeyboardInterrupt)
-#                     proc.send_signal(signal.SIGINT)
-#             except Exception as e:
-#                 print(f"Error sending signal to {name}: {e}")
-#                 # Fallback to terminate
-#                 try:
-#                     proc.terminate()
-#                 except:
-#                     pass
-    
-#     # Wait for processes to finish (give them time to process and save)
-#     print("Waiting for processes to finish...")
-#     for name, proc in list(recording_processes.items()):
-#         if proc:
-#             try:
-#                 # Give them time to catch KeyboardInterrupt and process
-#                 proc.wait(timeout=180)  # 3 minutes max
-#                 print(f"{name} finished with code {proc.returncode}")
-#             except subprocess.TimeoutExpired:
-#                 print(f"{name} timed out, killing...")
-#                 proc.kill()
-#                 proc.wait()
-#             except Exception as e:
-#                 print(f"Error waiting for {name}: {e}")
-    
-#     recording_processes = {}
-#     is_recording = False
-    
-#     # Wait for files to be created
-#     update_status("⏳ Processing...", "blue")
-#     root.update()
-    
-#     mic_file = os.path.join(script_dir, "Mic_transcript.txt")
-#     spk_file = os.path.join(script_dir, "Speaker_transcript.txt")
-    
-#     # Wait up to 120 seconds for files (transcription can take time)
-#     print("Waiting for transcript files...")
-#     for i in range(60):  # 60 * 2 = 120 seconds
-#         time.sleep(2)
-#         mic_exists = os.path.exists(mic_file)
-#         spk_exists = os.path.exists(spk_file)
-#         if mic_exists and spk_exists:
-#             print("Both transcript files found!")
-#             break
-#         if i % 5 == 0:  # Print status every 10 seconds
-#             print(f"Waiting... Mic: {mic_exists}, Speaker: {spk_exists}")
-#         root.update()
-    
-#     # Check if files exist
-#     if not os.path.exists(mic_file) or not os.path.exists(spk_file):
-#         missing = []
-#         if not os.path.exists(mic_file):
-#             missing.append("Mic_transcript.txt")
-#         if not os.path.exists(spk_file):
-#             missing.append("Speaker_transcript.txt")
-#         messagebox.showerror(
-#             "Error",
-#             f"Missing files:\n" + "\n".join(missing) + "\n\nCheck if recording captured audio."
-#         )
-#         update_status("❌ Failed", "red")
-#         button.config(text="▶ Start Recording", command=start_recording, state="normal")
-#         return
-    
-#     # Run combined script
-#     update_status("🔄 Merging...", "blue")
-#     root.update()
-    
-#     try:
-#         combined_path = os.path.join(script_dir, SCRIPT_PATHS["combined"])
-#         env = os.environ.copy()
-#         env['PYTHONIOENCODING'] = 'utf-8'
-        
-#         combined_proc = subprocess.Popen(
-#             [sys.executable, combined_path],
-#             stdout=subprocess.PIPE,
-#             stderr=subprocess.PIPE,
-#             text=True,
-#             encoding='utf-8',
-#             errors='replace',
-#             env=env,
-#             cwd=script_dir
-#         )
-        
-#         stdout, stderr = combined_proc.communicate(timeout=300)
-        
-#         if combined_proc.returncode != 0:
-#             print(f"Combined script error: {stderr[:500]}")
-#     except Exception as e:
-#         print(f"Error running combined script: {e}")
-    
-#     # Check results
-#     summary_file = os.path.join(script_dir, "Meeting_summary.txt")
-#     combined_file = os.path.join(script_dir, "Combined_transcript.txt")
-    
-#     if os.path.exists(summary_file) and os.path.exists(combined_file):
-#         update_status("✅ Complete!", "green")
-#         messagebox.showinfo(
-#             "Complete",
-#             "Files created:\n- Combined_transcript.txt\n- Meeting_summary.txt"
-#         )
-#     else:
-#         update_status("⚠️ Partial", "orange")
-#         messagebox.showwarning(
-#             "Warning",
-#             f"Combined: {'✓' if os.path.exists(combined_file) else '✗'}\n"
-#             f"Summary: {'✓' if os.path.exists(summary_file) else '✗'}"
-#         )
-    
-#     button.config(text="▶ Start Recording", command=start_recording, state="normal")
-
-
-# def update_status(text, color="black"):
-#     """Update status label."""
-#     if status_label:
-#         status_label.config(text=text, fg=color)
-
-
-# def monitor_meetings():
-#     """Background thread to monitor for meeting apps."""
-#     meeting_detected = False
-    
-#     while True:
-#         meeting_app = check_meeting_running()
-        
-#         if meeting_app and not meeting_detected:
-#             meeting_detected = True
-#             if root:
-#                 root.after(0, lambda: update_status(f"📹 {meeting_app} detected", "blue"))
-#                 root.after(0, lambda: button.config(state="normal"))
-        
-#         elif not meeting_app and meeting_detected:
-#             meeting_detected = False
-#             if root and not is_recording:
-#                 root.after(0, lambda: update_status("⏸ No meeting", "gray"))
-#                 root.after(0, lambda: button.config(state="disabled"))
-        
-#         time.sleep(2)
-
-
-# def create_gui():
-#     """Create the main GUI window."""
-#     global root, status_label, button
-    
-#     root = tk.Tk()
-#     root.title("OCTI Meeting Recorder")
-#     root.geometry("400x200")
-#     root.resizable(False, False)
-    
-#     # Center window
-#     root.update_idletasks()
-#     x = (root.winfo_screenwidth() // 2) - (400 // 2)
-#     y = (root.winfo_screenheight() // 2) - (200 // 2)
-#     root.geometry(f"400x200+{x}+{y}")
-    
-#     root.attributes("-topmost", True)
-    
-#     # Title
-#     title_label = tk.Label(
-#         root,
-#         text="🎙 OCTI Meeting Recorder",
-#         font=("Arial", 16, "bold"),
-#         pady=20
-#     )
-#     title_label.pack()
-    
-#     # Status label
-#     status_label = tk.Label(
-#         root,
-#         text="🔍 Detecting meetings...",
-#         font=("Arial", 10),
-#         fg="gray",
-#         pady=10
-#     )
-#     status_label.pack()
-    
-#     # Button
-#     button = tk.Button(
-#         root,
-#         text="▶ Start Recording",
-#         font=("Arial", 12, "bold"),
-#         bg="#4CAF50",
-#         fg="white",
-#         activebackground="#45a049",
-#         activeforeground="white",
-#         width=20,
-#         height=2,
-#         state="disabled",
-#         command=start_recording,
-#         cursor="hand2"
-#     )
-#     button.pack(pady=10)
-    
-#     # Start monitoring thread
-#     monitor_thread = threading.Thread(target=monitor_meetings, daemon=True)
-#     monitor_thread.start()
-    
-#     # Handle window close
-#     def on_closing():
-#         if is_recording:
-#             if messagebox.askokcancel("Quit", "Recording in progress. Stop and quit?"):
-#                 stop_recording()
-#                 time.sleep(1)
-#                 root.destroy()
-#         else:
-#             root.destroy()
-    
-#     root.protocol("WM_DELETE_WINDOW", on_closing)
-#     root.mainloop()
-
-
-# if __name__ == "__main__":
-#     try:
-#         import psutil
-#     except ImportError:
-#         print("Error: psutil not installed. Install it with: pip install psutil")
-#         sys.exit(1)
-    
-#     script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
-#     missing = [path for path in SCRIPT_PATHS.values() 
-#                if not os.path.exists(os.path.join(script_dir, path))]
-#     if missing:
-#         print(f"Error: Missing scripts: {', '.join(missing)}")
-#         sys.exit(1)
-    
-#     print("Starting OCTI Meeting Launcher...")
-#     create_gui()
-
+"""
+OCTI Meeting Launcher - Windows Orchestrator
+Automatically detects meetings and manages transcription scripts.
+Small circular bubble UI with octopus logo.
+"""
+
+import subprocess
+import psutil
+import time
+import os
+import sys
+import signal
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+import tkinter as tk
+from tkinter import ttk
+try:
+    from watchdog.observers import Observer           # pip install watchdog
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None   # fall back to polling
+
+# Configuration
+MEETING_APPS = {
+    "Zoom": ["Zoom.exe", "CptHost.exe"],
+    "Teams": ["ms-teams.exe", "Teams.exe"],
+    "Google Meet": ["chrome.exe", "msedge.exe", "firefox.exe"],
+}
+
+SCRIPT_PATHS = {
+    "mic": "octiMic.py",
+    "speaker": "octiSpeaker.py",
+    "combined": "octiCombined.py"
+}
+
+# Raw browsers are skipped (original behavior): Chrome running doesn't
+# mean a Meet call is active
+_EXCLUDED_PROCS = {"chrome.exe", "msedge.exe", "firefox.exe"}
+
+# Flat lowercase exe-name -> app map built once at import, so each poll
+# does one O(1) lookup per process instead of a nested dict+list scan
+_TARGETS = {
+    name.lower(): app
+    for app, names in MEETING_APPS.items()
+    for name in names
+    if name.lower() not in _EXCLUDED_PROCS
+}
+_TARGET_SET = frozenset(_TARGETS)
+
+# Detection caching / polling cadence: results are reused within the
+# TTL, and the monitor polls slower while no meeting is running
+DETECT_TTL = 2.0
+MONITOR_ACTIVE_INTERVAL = 2.0
+MONITOR_IDLE_INTERVAL = 5.0
+
+_detect_cache = (0.0, None)   # (monotonic timestamp, last result)
+
+
+# --------- Fast Windows process enumeration (Toolhelp32) --------- #
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _TH32CS_SNAPPROCESS = 0x00000002
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    # Without an explicit restype ctypes truncates the returned HANDLE
+    # to a c_int, which can never compare equal to the unsigned
+    # INVALID_HANDLE_VALUE above — snapshot failures went undetected
+    _kernel32 = ctypes.windll.kernel32
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+    class _PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", ctypes.c_long),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", ctypes.c_wchar * 260),
+        ]
+
+    _kernel32.Process32FirstW.restype = wintypes.BOOL
+    _kernel32.Process32FirstW.argtypes = (wintypes.HANDLE,
+                                          ctypes.POINTER(_PROCESSENTRY32W))
+    _kernel32.Process32NextW.restype = wintypes.BOOL
+    _kernel32.Process32NextW.argtypes = (wintypes.HANDLE,
+                                         ctypes.POINTER(_PROCESSENTRY32W))
+
+    def _win_process_names():
+        """Yield lowercased exe names from a single Toolhelp32 snapshot."""
+        snap = _kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+        if snap == _INVALID_HANDLE_VALUE:
+            return
+        try:
+            entry = _PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+            ok = _kernel32.Process32FirstW(snap, ctypes.byref(entry))
+            while ok:
+                yield entry.szExeFile.lower()
+                ok = _kernel32.Process32NextW(snap, ctypes.byref(entry))
+        finally:
+            _kernel32.CloseHandle(snap)
+
+# Pre-scaled offline to the bubble's logo size (55% of BUBBLE_SIZE), so
+# the stock tk.PhotoImage loader is enough — no PIL import and no
+# Lanczos resample on every launch
+LOGO_FILE = "octopus_logo_38.png"
+
+# Resolved once at import: recomputing script_dir in every function cost
+# a getcwd syscall each time and could disagree if the cwd changed mid-run
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
+SCRIPT_FULL_PATHS = {k: os.path.join(SCRIPT_DIR, v)
+                     for k, v in SCRIPT_PATHS.items()}
+MIC_TRANSCRIPT = os.path.join(SCRIPT_DIR, "Mic_transcript.txt")
+SPK_TRANSCRIPT = os.path.join(SCRIPT_DIR, "Speaker_transcript.txt")
+COMBINED_TRANSCRIPT = os.path.join(SCRIPT_DIR, "Combined_transcript.txt")
+SUMMARY_FILE = os.path.join(SCRIPT_DIR, "Meeting_summary.txt")
+LOGO_PATH = os.path.join(SCRIPT_DIR, LOGO_FILE)
+
+# Bubble config
+BUBBLE_SIZE = 70        # small bubble
+BORDER_WIDTH = 6        # thick outer ring
+
+# Child environment, built once. We never mutate the parent env, so
+# there's no reason to re-copy the whole environment block per spawn.
+CHILD_ENV = {**os.environ, "PYTHONIOENCODING": "utf-8"}
+
+# Shared recorder state. The click handler, the monitor thread and the
+# start/stop workers all touch this, so every access goes through
+# STATE_LOCK instead of racing on loose module globals.
+@dataclass
+class RecorderState:
+    procs: dict = field(default_factory=dict)
+    create_times: dict = field(default_factory=dict)   # name -> spawn create_time
+    recording: bool = False
+    stopping: bool = False   # a stop is in progress; child exits are expected
+
+
+STATE = RecorderState()
+STATE_LOCK = threading.Lock()
+
+# Every child we spawn, keyed by pid. The SIGCHLD drain on POSIX reaps
+# with waitpid(-1) and hands each exit status back to the right Popen
+# here — without this, a later proc.poll()/wait() on an already-reaped
+# child would report nothing (or lie about the exit code).
+_children = {}
+_orphan_status = {}   # pid -> status reaped before _track_child ran
+_children_lock = threading.Lock()
+
+
+def _track_child(proc):
+    with _children_lock:
+        status = _orphan_status.pop(proc.pid, None)
+        if status is not None:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+        else:
+            _children[proc.pid] = proc
+
+
+def _is_recording():
+    with STATE_LOCK:
+        return STATE.recording
+
+
+def _create_time(proc):
+    """Fingerprint a freshly spawned child by its kernel create time."""
+    try:
+        return psutil.Process(proc.pid).create_time()
+    except psutil.NoSuchProcess:
+        return None   # died before we could look; poll() will see it
+
+
+def _same_process(proc, created):
+    """True if proc.pid still refers to the child we spawned.
+
+    PIDs get recycled: if a child crashed and the OS reassigned its pid,
+    signalling by pid alone could hit an unrelated process. create_time
+    is the same identity key psutil itself uses, so pid + create_time
+    uniquely names one process incarnation.
+    """
+    if created is None:
+        return True   # no fingerprint taken; fall back to pid-only
+    try:
+        return psutil.Process(proc.pid).create_time() == created
+    except psutil.NoSuchProcess:
+        return False
+
+
+# Global UI state (Tk thread only)
+_stop_thread = None   # worker running the stop/merge pipeline
+root = None
+status_label = None   # kept for compatibility with your logic
+button = None         # kept for compatibility with your logic
+
+# bubble drawing state
+canvas = None
+border_circle_id = None
+logo_img = None
+drag_offset_x = 0
+drag_offset_y = 0
+
+
+def _scan_for_meeting():
+    # On Windows, one Toolhelp snapshot returns every exe name in a
+    # single kernel round-trip — far cheaper than per-PID NT calls.
+    # Matching is one C-level set intersection against the frozen
+    # target set; no Python branching per process.
+    if sys.platform == "win32":
+        names = _win_process_names()
+    else:
+        names = (name.lower() for proc in psutil.process_iter(['name'])
+                 if (name := proc.info['name']))
+
+    hit = _TARGET_SET.intersection(names)
+    if hit:
+        return _TARGETS[next(iter(hit))]
+    return None
+
+
+def check_meeting_running():
+    """Check if any meeting app is running (cached for DETECT_TTL seconds)."""
+    global _detect_cache
+
+    now = time.monotonic()
+    ts, result = _detect_cache
+    if now - ts < DETECT_TTL:
+        return result
+
+    result = _scan_for_meeting()
+    _detect_cache = (now, result)
+    return result
+
+
+# --------- Bubble helpers (pure UI) --------- #
+
+def _ui(fn, *args, **kwargs):
+    """Marshal a UI mutation onto the Tk mainloop thread."""
+    if root:
+        root.after(0, lambda: fn(*args, **kwargs))
+
+
+def set_border_color(color: str):
+    """Change the outer ring color of the bubble."""
+    global canvas, border_circle_id
+    if canvas is not None and border_circle_id is not None:
+        canvas.itemconfig(border_circle_id, outline=color)
+
+
+_tooltip = None
+
+
+def _notify(text, color="#ff4444"):
+    """Non-modal notification: tint the bubble ring and float a small
+    tooltip next to it, auto-clearing after a few seconds.
+
+    messagebox dialogs are modal and stall the mainloop until dismissed,
+    which would undo the worker-thread refactor — the bubble would stop
+    responding to drags and clicks. Runs on the Tk thread.
+    """
+    global _tooltip
+    print(text)
+    set_border_color(color)
+
+    if root is None:
+        return
+
+    if _tooltip is not None:
+        try:
+            _tooltip.destroy()
+        except tk.TclError:
+            pass
+        _tooltip = None
+
+    tip = tk.Toplevel(root)
+    tip.overrideredirect(True)
+    tip.attributes("-topmost", True)
+    tk.Label(tip, text=text, bg="#333333", fg="white",
+             font=("Arial", 9), justify="left",
+             padx=8, pady=4).pack()
+    tip.geometry(f"+{root.winfo_x() + BUBBLE_SIZE + 8}+{root.winfo_y()}")
+    _tooltip = tip
+
+    def _clear():
+        global _tooltip
+        if _tooltip is tip:
+            _tooltip = None
+            set_border_color("gray")
+        try:
+            tip.destroy()
+        except tk.TclError:
+            pass
+
+    root.after(4000, _clear)
+
+
+def show_bubble():
+    if root:
+        root.deiconify()
+        root.attributes("-alpha", 0.98)
+
+
+def hide_bubble():
+    if root:
+        root.withdraw()
+
+
+def on_bubble_press(event):
+    """For dragging."""
+    global drag_offset_x, drag_offset_y
+    drag_offset_x = event.x
+    drag_offset_y = event.y
+
+
+# Drag coalescing: <B1-Motion> can fire at 100+ Hz and every geometry()
+# call is a synchronous window move. Pending motion is folded into one
+# after_idle move per event-loop cycle.
+_pending_drag = None
+_last_drag_pos = (None, None)
+
+
+def _apply_drag():
+    global _pending_drag, _last_drag_pos
+    if _pending_drag is None:
+        return
+    x, y = _pending_drag
+    _pending_drag = None
+    _last_drag_pos = (x, y)
+    root.geometry(f"{BUBBLE_SIZE}x{BUBBLE_SIZE}+{x}+{y}")
+
+
+def on_bubble_drag(event):
+    """Drag bubble around screen."""
+    global _pending_drag
+    x = event.x_root - drag_offset_x
+    y = event.y_root - drag_offset_y
+
+    # Sub-pixel jitter isn't a move
+    lx, ly = _last_drag_pos
+    if lx is not None and abs(x - lx) <= 1 and abs(y - ly) <= 1:
+        return
+
+    scheduled = _pending_drag is not None
+    _pending_drag = (x, y)
+    if not scheduled:
+        root.after_idle(_apply_drag)
+
+
+def on_bubble_click(event):
+    """Left-click: toggle start/stop using your existing functions."""
+    if not _is_recording():
+        start_recording()
+    else:
+        stop_recording()
+
+
+# --------- ORIGINAL LOGIC (UNCHANGED except border color calls) --------- #
+
+def start_recording():
+    """Start recording. The spawn-and-verify work runs on a worker
+    thread so the click handler returns immediately."""
+    with STATE_LOCK:
+        if STATE.recording:
+            return
+        STATE.recording = True
+        STATE.stopping = False
+        STATE.procs = {}
+        STATE.create_times = {}
+
+    # Verify scripts exist
+    for script_type, full_path in SCRIPT_FULL_PATHS.items():
+        if not os.path.exists(full_path):
+            _notify(f"Script not found: {full_path}")
+            with STATE_LOCK:
+                STATE.recording = False
+            return
+
+    threading.Thread(target=_start_worker, daemon=True).start()
+
+
+def _start_worker():
+    """Blocking half of start_recording; UI updates go through _ui."""
+    try:
+        # Own process group on Windows so CTRL_BREAK_EVENT can actually
+        # be delivered to the children at stop time (a console-control
+        # event can only target a group, and CTRL_C can only target
+        # group 0 — the whole console)
+        creationflags = (subprocess.CREATE_NEW_PROCESS_GROUP
+                         if sys.platform == "win32" else 0)
+
+        # Start mic script
+        mic_path = SCRIPT_FULL_PATHS["mic"]
+        print(f"Starting mic: {mic_path}")
+        mic_proc = subprocess.Popen(
+            [sys.executable, mic_path],
+            stdout=subprocess.DEVNULL,  # Don't capture - let it run freely
+            stderr=subprocess.DEVNULL,
+            env=CHILD_ENV,
+            cwd=SCRIPT_DIR,
+            creationflags=creationflags
+        )
+        _track_child(mic_proc)
+        with STATE_LOCK:
+            STATE.procs["mic"] = mic_proc
+            STATE.create_times["mic"] = _create_time(mic_proc)
+
+        # Start speaker script
+        speaker_path = SCRIPT_FULL_PATHS["speaker"]
+        print(f"Starting speaker: {speaker_path}")
+        speaker_proc = subprocess.Popen(
+            [sys.executable, speaker_path],
+            stdout=subprocess.DEVNULL,  # Don't capture - let it run freely
+            stderr=subprocess.DEVNULL,
+            env=CHILD_ENV,
+            cwd=SCRIPT_DIR,
+            creationflags=creationflags
+        )
+        _track_child(speaker_proc)
+        with STATE_LOCK:
+            STATE.procs["speaker"] = speaker_proc
+            STATE.create_times["speaker"] = _create_time(speaker_proc)
+        
+        # Check if they started: poll in 100 ms ticks with early exit
+        # instead of a fixed 2-second sleep. Both still running after
+        # 500 ms counts as a successful start.
+        for i in range(5):
+            time.sleep(0.1)
+            if mic_proc.poll() is not None or speaker_proc.poll() is not None:
+                break
+
+        if mic_proc.poll() is not None:
+            print(f"Mic script exited immediately with code {mic_proc.returncode}")
+            _ui(_notify,
+                f"Mic script failed to start (exit code {mic_proc.returncode})")
+            if speaker_proc.poll() is None:
+                speaker_proc.terminate()
+            with STATE_LOCK:
+                STATE.recording = False
+                STATE.procs = {}
+                STATE.create_times = {}
+            return
+
+        if speaker_proc.poll() is not None:
+            print(f"Speaker script exited immediately with code {speaker_proc.returncode}")
+            _ui(_notify,
+                f"Speaker script failed to start (exit code {speaker_proc.returncode})")
+            if mic_proc.poll() is None:
+                mic_proc.terminate()
+            with STATE_LOCK:
+                STATE.recording = False
+                STATE.procs = {}
+                STATE.create_times = {}
+            return
+
+        _ui(update_status, "🟢 Recording...", "green")
+        _ui(set_border_color, "#00C851")  # bright green ring
+        # Get told when a child dies instead of discovering it at stop
+        _ui(_register_child_exit_watch, [mic_proc, speaker_proc])
+        # button is invisible, but keep behaviour so logic untouched
+        if button:
+            _ui(button.config, text="⏹ Stop Recording", command=stop_recording)
+
+    except Exception as e:
+        _ui(_notify, f"Failed to start: {e}")
+        with STATE_LOCK:
+            STATE.recording = False
+            STATE.procs = {}
+            STATE.create_times = {}
+
+
+def _on_child_exit():
+    # Only interesting while a recording is supposed to be running;
+    # during a stop (STATE.stopping) the children exit on purpose —
+    # recording stays true until wait_procs returns, so the flag alone
+    # would still warn on every normal stop
+    with STATE_LOCK:
+        unexpected = STATE.recording and not STATE.stopping
+    if unexpected:
+        update_status("⚠ Recorder exited during meeting", "red")
+        set_border_color("#ff4444")
+
+
+def _install_sigchld_watch():
+    """POSIX: learn about child exits from one SIGCHLD per exit instead
+    of polling each Popen.
+
+    The handler only writes a byte to a self-pipe (the classic trick —
+    nothing else is async-signal-safe); Tk's createfilehandler wakes on
+    the pipe and the drain reaps every exited child with
+    waitpid(-1, WNOHANG), routing each status back to its Popen via
+    _children. Must run on the main thread, before any child is
+    spawned. Windows has no SIGCHLD and keeps the polling path in
+    _register_child_exit_watch.
+    """
+    rfd, wfd = os.pipe()
+    os.set_blocking(wfd, False)
+
+    def _on_sigchld(signum, frame):
+        try:
+            os.write(wfd, b"x")
+        except OSError:
+            pass   # pipe full: a wakeup is already pending
+
+    signal.signal(signal.SIGCHLD, _on_sigchld)
+
+    def _drain(fd, mask):
+        try:
+            os.read(fd, 512)
+        except OSError:
+            pass
+
+        exited = []
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break   # no children at all
+            if pid == 0:
+                break   # children exist but none exited
+            exited.append(pid)
+            with _children_lock:
+                proc = _children.pop(pid, None)
+                if proc is None:
+                    # Reaped before _track_child ran; park the status
+                    # so tracking picks it up
+                    _orphan_status[pid] = status
+            if proc is not None and proc.returncode is None:
+                proc.returncode = os.waitstatus_to_exitcode(status)
+
+        if not exited:
+            return
+        with STATE_LOCK:
+            tracked = {p.pid for p in STATE.procs.values() if p}
+        if tracked.intersection(exited):
+            _on_child_exit()
+
+    root.tk.createfilehandler(rfd, tk.READABLE, _drain)
+
+
+def _register_child_exit_watch(procs):
+    """Wake the Tk event loop when a recorder child exits.
+
+    On POSIX this is a no-op: the SIGCHLD watch installed at startup
+    already covers every child. Windows lacks SIGCHLD, so there a
+    root.after poll is used instead. Runs on the Tk thread.
+    """
+    if root is None or sys.platform != "win32":
+        return
+
+    def _poll():
+        if not _is_recording():
+            return
+        if any(p.poll() is not None for p in procs):
+            _on_child_exit()
+        else:
+            root.after(500, _poll)
+
+    root.after(500, _poll)
+
+
+def _wait_for_transcripts(mic_file, spk_file, timeout=120):
+    """Wait until both transcript files exist.
+
+    Uses filesystem notifications when watchdog is available, so we wake
+    the instant the files appear instead of burning CPU in a 2s poll.
+    """
+    if os.path.exists(mic_file) and os.path.exists(spk_file):
+        return True
+
+    if Observer is None:
+        # Polling fallback when watchdog isn't installed. One scandir
+        # per tick answers both existence questions from a single
+        # directory read instead of two stat calls.
+        watch_dir = os.path.dirname(mic_file) or "."
+        mic_name = os.path.basename(mic_file)
+        spk_name = os.path.basename(spk_file)
+        for i in range(timeout // 2):
+            time.sleep(2)
+            entries = {e.name for e in os.scandir(watch_dir)}
+            mic_exists = mic_name in entries
+            spk_exists = spk_name in entries
+            if mic_exists and spk_exists:
+                return True
+            if i % 5 == 0:  # Print status every 10 seconds
+                print(f"Waiting... Mic: {mic_exists}, Speaker: {spk_exists}")
+        return False
+
+    both_exist = threading.Event()
+
+    class _TranscriptHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            if os.path.exists(mic_file) and os.path.exists(spk_file):
+                both_exist.set()
+
+    observer = Observer()
+    observer.schedule(_TranscriptHandler(),
+                      os.path.dirname(mic_file) or ".",
+                      recursive=False)
+    observer.start()
+    try:
+        # Re-check after the watch is live to close the startup race
+        if os.path.exists(mic_file) and os.path.exists(spk_file):
+            return True
+        return both_exist.wait(timeout)
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def stop_recording():
+    """Stop recording. The slow work (signalling children, waiting for
+    transcripts, running the merge) happens on a worker thread so the
+    Tk mainloop keeps running and the bubble stays responsive."""
+    global _stop_thread
+
+    if not _is_recording():
+        return
+    if _stop_thread and _stop_thread.is_alive():
+        return   # stop already in progress
+
+    _stop_thread = threading.Thread(target=_stop_worker, daemon=True)
+    _stop_thread.start()
+
+
+def _stop_worker():
+    """Blocking half of stop_recording; never touches Tk directly."""
+    with STATE_LOCK:
+        STATE.stopping = True
+        running_procs = dict(STATE.procs)
+        create_times = dict(STATE.create_times)
+
+    _ui(update_status, "⏸ Stopping...", "orange")
+    _ui(set_border_color, "#ff4444")  # red while stopping/processing
+    if button:
+        _ui(button.config, state="disabled")
+
+    # Stop processes - send SIGINT (KeyboardInterrupt) so they can save files
+    for name, proc in running_procs.items():
+        if proc and proc.poll() is None:
+            # Never signal a recycled pid — verify the process is still
+            # the exact incarnation we spawned before touching it
+            if not _same_process(proc, create_times.get(name)):
+                print(f"{name} pid {proc.pid} was recycled, skipping")
+                continue
+            try:
+                if sys.platform == "win32":
+                    # CTRL_BREAK_EVENT is the event that can target a
+                    # specific process group; children map it to
+                    # KeyboardInterrupt so they can save their files
+                    try:
+                        proc.send_signal(signal.CTRL_BREAK_EVENT)
+                    except:
+                        # If that fails, use terminate
+                        proc.terminate()
+                else:
+                    # On Unix, send SIGINT (KeyboardInterrupt)
+                    proc.send_signal(signal.SIGINT)
+            except Exception as e:
+                print(f"Error sending signal to {name}: {e}")
+                # Fallback to terminate
+                try:
+                    proc.terminate()
+                except:
+                    pass
+    
+    # Wait for processes to finish (give them time to process and save).
+    # wait_procs waits on both children under one shared timeout instead
+    # of up to 180s each in sequence.
+    print("Waiting for processes to finish...")
+    procs = []
+    for name, proc in running_procs.items():
+        if proc:
+            try:
+                p = psutil.Process(proc.pid)
+                ct = create_times.get(name)
+                if ct is not None and p.create_time() != ct:
+                    print(f"{name} pid {proc.pid} was recycled, not waiting")
+                    continue
+                procs.append(p)
+            except psutil.NoSuchProcess:
+                print(f"{name} already gone")
+
+    gone, alive = psutil.wait_procs(
+        procs,
+        timeout=180,  # 3 minutes max, shared
+        callback=lambda p: print(f"{p.pid} finished with code {p.returncode}")
+    )
+    for p in alive:
+        print(f"{p.pid} timed out, killing...")
+        try:
+            p.kill()
+        except psutil.NoSuchProcess:
+            pass
+    if alive:
+        psutil.wait_procs(alive, timeout=5)
+
+    with STATE_LOCK:
+        STATE.procs = {}
+        STATE.create_times = {}
+        STATE.recording = False
+        STATE.stopping = False
+
+    # Wait for files to be created
+    _ui(update_status, "⏳ Processing...", "blue")
+
+    # Wait up to 120 seconds for files (transcription can take time)
+    print("Waiting for transcript files...")
+    if _wait_for_transcripts(MIC_TRANSCRIPT, SPK_TRANSCRIPT, timeout=120):
+        print("Both transcript files found!")
+
+    # Check if files exist
+    if not os.path.exists(MIC_TRANSCRIPT) or not os.path.exists(SPK_TRANSCRIPT):
+        missing = []
+        if not os.path.exists(MIC_TRANSCRIPT):
+            missing.append("Mic_transcript.txt")
+        if not os.path.exists(SPK_TRANSCRIPT):
+            missing.append("Speaker_transcript.txt")
+        _ui(_notify,
+            f"Missing files:\n" + "\n".join(missing) + "\n\nCheck if recording captured audio.")
+        _ui(update_status, "❌ Failed", "red")
+        if button:
+            _ui(button.config, text="▶ Start Recording",
+                command=start_recording, state="normal")
+        return
+
+    # Run combined script
+    _ui(update_status, "🔄 Merging...", "blue")
+
+    try:
+        combined_path = SCRIPT_FULL_PATHS["combined"]
+
+        combined_proc = subprocess.Popen(
+            [sys.executable, combined_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=1,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            env=CHILD_ENV,
+            cwd=SCRIPT_DIR
+        )
+        _track_child(combined_proc)
+
+        # Tail stderr into a bounded ring instead of buffering all of
+        # it in memory — only the last lines matter on failure
+        stderr_tail = deque(maxlen=32)
+
+        def _drain_stderr():
+            for line in combined_proc.stderr:
+                stderr_tail.append(line)
+
+        drainer = threading.Thread(target=_drain_stderr, daemon=True)
+        drainer.start()
+
+        try:
+            combined_proc.wait(timeout=300)
+        except subprocess.TimeoutExpired:
+            print("Combined script timed out, killing...")
+            combined_proc.kill()
+            combined_proc.wait()
+        drainer.join(timeout=5)
+
+        if combined_proc.returncode != 0:
+            print(f"Combined script error: {''.join(stderr_tail)[:500]}")
+    except Exception as e:
+        print(f"Error running combined script: {e}")
+    
+    # Check results
+    summary_file = SUMMARY_FILE
+    combined_file = COMBINED_TRANSCRIPT
+
+    if os.path.exists(summary_file) and os.path.exists(combined_file):
+        _ui(update_status, "✅ Complete!", "green")
+        _ui(_notify,
+            "Files created:\n- Combined_transcript.txt\n- Meeting_summary.txt",
+            "#00C851")
+    else:
+        _ui(update_status, "⚠️ Partial", "orange")
+        _ui(_notify,
+            f"Combined: {'✓' if os.path.exists(combined_file) else '✗'}\n"
+            f"Summary: {'✓' if os.path.exists(summary_file) else '✗'}",
+            "orange")
+
+    if button:
+        _ui(button.config, text="▶ Start Recording",
+            command=start_recording, state="normal")
+
+    # after everything, hide bubble (scheduled from the Tk thread; the
+    # worker never talks to the interpreter directly)
+    _ui(root.after, 1000, hide_bubble)
+
+
+def update_status(text, color="black"):
+    """Update status label (still exists but not shown visually)."""
+    if status_label:
+        status_label.config(text=text, fg=color)
+    # Also print to console for debugging
+    print(text)
+
+
+# Set at shutdown so the monitor thread exits immediately instead of
+# finishing out a sleep
+stop_event = threading.Event()
+
+
+def monitor_meetings():
+    """Background thread to monitor for meeting apps."""
+    # Detection is background work; on Windows, drop this thread below
+    # normal priority so it never competes with the UI thread
+    if sys.platform == "win32":
+        kernel32 = ctypes.windll.kernel32
+        # -1 == THREAD_PRIORITY_BELOW_NORMAL
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), -1)
+
+    meeting_detected = False
+
+    while not stop_event.is_set():
+        meeting_app = check_meeting_running()
+        
+        if meeting_app and not meeting_detected:
+            meeting_detected = True
+            if root:
+                root.after(0, lambda: update_status(f"📹 {meeting_app} detected", "blue"))
+                root.after(0, show_bubble)
+        
+        elif not meeting_app and meeting_detected:
+            meeting_detected = False
+            if root and not _is_recording():
+                root.after(0, lambda: update_status("⏸ No meeting", "gray"))
+                root.after(0, hide_bubble)
+
+        # Poll slower while idle; meetings still get picked up within
+        # the idle interval. Event.wait (unlike time.sleep) returns the
+        # moment stop_event is set, so shutdown never waits out a tick.
+        stop_event.wait(MONITOR_ACTIVE_INTERVAL if meeting_detected
+                        else MONITOR_IDLE_INTERVAL)
+
+
+def create_gui():
+    """Create the small circular bubble window."""
+    global root, status_label, button, canvas, border_circle_id, logo_img
+    
+    root = tk.Tk()
+    root.title("OCTI Meeting Recorder")
+    
+    # Small borderless always-on-top window
+    root.geometry(f"{BUBBLE_SIZE}x{BUBBLE_SIZE}")
+    root.overrideredirect(True)
+    root.attributes("-topmost", True)
+
+    # Make window background transparent except bubble
+    TRANSPARENT_COLOR = "#ff00ff"
+    root.config(bg=TRANSPARENT_COLOR)
+    root.wm_attributes("-transparentcolor", TRANSPARENT_COLOR)
+    
+    # Position near top-right
+    root.update_idletasks()
+    screen_w = root.winfo_screenwidth()
+    x = screen_w - BUBBLE_SIZE - 40
+    y = 80
+    root.geometry(f"{BUBBLE_SIZE}x{BUBBLE_SIZE}+{x}+{y}")
+    
+    # Canvas for bubble
+    canvas = tk.Canvas(
+        root,
+        width=BUBBLE_SIZE,
+        height=BUBBLE_SIZE,
+        highlightthickness=0,
+        bg=TRANSPARENT_COLOR
+    )
+    canvas.pack(fill="both", expand=True)
+    
+    # Draw white circle with colored border (initially gray)
+    padding = 4
+    border_circle_id = canvas.create_oval(
+        padding,
+        padding,
+        BUBBLE_SIZE - padding,
+        BUBBLE_SIZE - padding,
+        outline="gray",
+        width=BORDER_WIDTH,
+        fill="white"
+    )
+    
+    # Load the pre-scaled logo
+    try:
+        logo_img = tk.PhotoImage(file=LOGO_PATH)
+        canvas.create_image(
+            BUBBLE_SIZE // 2,
+            BUBBLE_SIZE // 2,
+            image=logo_img
+        )
+    except Exception as e:
+        print("Logo load error:", e)
+    
+    # Invisible label & button (for compatibility with your existing logic)
+    status_label = tk.Label(root)
+    button = tk.Button(root)
+    # not packing them => they never show
+    
+    # Mouse bindings
+    canvas.bind("<ButtonPress-1>", on_bubble_press)
+    canvas.bind("<B1-Motion>", on_bubble_drag)
+    canvas.bind("<ButtonRelease-1>", on_bubble_click)
+    
+    # One SIGCHLD per child exit beats polling every Popen (POSIX only)
+    if sys.platform != "win32":
+        _install_sigchld_watch()
+
+    # Start monitoring thread
+    monitor_thread = threading.Thread(target=monitor_meetings, daemon=True)
+    monitor_thread.start()
+
+    # Stop the monitor immediately on close instead of leaving it to
+    # wait out its poll interval
+    def _on_close():
+        stop_event.set()
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", _on_close)
+
+    # Start hidden until meeting is detected
+    hide_bubble()
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    try:
+        import psutil  # ensure installed
+    except ImportError:
+        print("Error: psutil not installed. Install it with: pip install psutil")
+        sys.exit(1)
+    
+    missing = [path for path in SCRIPT_FULL_PATHS.values()
+               if not os.path.exists(path)]
+    if missing:
+        print(f"Error: Missing scripts: {', '.join(missing)}")
+        sys.exit(1)
+    
+    print("Starting OCTI Meeting Launcher...")
+    create_gui()
+
+
+#_______________________________________________________Older Version______________________________________________________________________________________________
+# #!/usr/bin/env python3
+# """
+# OCTI Meeting Launcher - Windows Orchestrator
+# Automatically detects meetings and manages transcription scripts.
+# """
+
+# import subprocess
+# import psutil
+# import time
+# import os
+# import sys
+# import signal
+# import threading
+# import tkinter as tk
+# from tkinter import ttk, messagebox
+
+# # Configuration
+# MEETING_APPS = {
+#     "Zoom": ["Zoom.exe", "CptHost.exe"],
+#     "Teams": ["ms-teams.exe", "Teams.exe"],
+#     "Google Meet": ["chrome.exe", "msedge.exe", "firefox.exe"],
+# }
+
+# SCRIPT_PATHS = {
+#     "mic": "octiMic.py",
+#     "speaker": "octiSpeaker.py",
+#     "combined": "octiCombined.py"
+# }
+
+# # Global state
+# recording_processes = {}
+# is_recording = False
+# root = None
+# status_label = None
+# button = None
+
+
+# def check_meeting_running():
+#     """Check if any meeting app is running."""
+#     running_processes = {p.name().lower(): p for p in psutil.process_iter(['name'])}
+    
+#     for app_name, process_names in MEETING_APPS.items():
+#         for proc_name in process_names:
+#             if proc_name.lower() in running_processes:
+#                 if proc_name.lower() in ["chrome.exe", "msedge.exe", "firefox.exe"]:
+#                     continue
+#                 return app_name
+    
+#     return None
+
+
+# def start_recording():
+#     """Start all recording scripts."""
+#     global recording_processes, is_recording
+    
+#     if is_recording:
+#         return
+    
+#     # Verify scripts exist
+#     script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
+#     for script_type, script_path in SCRIPT_PATHS.items():
+#         full_path = os.path.join(script_dir, script_path)
+#         if not os.path.exists(full_path):
+#             messagebox.showerror("Error", f"Script not found: {full_path}")
+#             return
+    
+#     is_recording = True
+#     recording_processes = {}
+    
+#     try:
+#         env = os.environ.copy()
+#         env['PYTHONIOENCODING'] = 'utf-8'
+        
+#         # Start mic script
+#         mic_path = os.path.join(script_dir, SCRIPT_PATHS["mic"])
+#         print(f"Starting mic: {mic_path}")
+#         mic_proc = subprocess.Popen(
+#             [sys.executable, mic_path],
+#             stdout=subprocess.DEVNULL,  # Don't capture - let it run freely
+#             stderr=subprocess.DEVNULL,
+#             env=env,
+#             cwd=script_dir
+#         )
+#         recording_processes["mic"] = mic_proc
+        
+#         # Start speaker script
+#         speaker_path = os.path.join(script_dir, SCRIPT_PATHS["speaker"])
+#         print(f"Starting speaker: {speaker_path}")
+#         speaker_proc = subprocess.Popen(
+#             [sys.executable, speaker_path],
+#             stdout=subprocess.DEVNULL,  # Don't capture - let it run freely
+#             stderr=subprocess.DEVNULL,
+#             env=env,
+#             cwd=script_dir
+#         )
+#         recording_processes["speaker"] = speaker_proc
+        
+#         # Wait a moment to check if they started
+#         time.sleep(2)
+        
+#         # Check if processes are still running
+#         if mic_proc.poll() is not None:
+#             print(f"Mic script exited immediately with code {mic_proc.returncode}")
+#             messagebox.showerror("Error", f"Mic script failed to start (exit code {mic_proc.returncode})")
+#             if speaker_proc.poll() is None:
+#                 speaker_proc.terminate()
+#             is_recording = False
+#             recording_processes = {}
+#             return
+        
+#         if speaker_proc.poll() is not None:
+#             print(f"Speaker script exited immediately with code {speaker_proc.returncode}")
+#             messagebox.showerror("Error", f"Speaker script failed to start (exit code {speaker_proc.returncode})")
+#             if mic_proc.poll() is None:
+#                 mic_proc.terminate()
+#             is_recording = False
+#             recording_processes = {}
+#             return
+        
+#         update_status("🟢 Recording...", "green")
+#         button.config(text="⏹ Stop Recording", command=stop_recording)
+        
+#     except Exception as e:
+#         messagebox.showerror("Error", f"Failed to start: {e}")
+#         is_recording = False
+#         recording_processes = {}
+
+
+# def stop_recording():
+#     """Stop all recording scripts and process."""
+#     global recording_processes, is_recording
+    
+#     if not is_recording:
+#         return
+    
+#     script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
+    
+#     update_status("⏸ Stopping...", "orange")
+#     button.config(state="disabled")
+#     root.update()
+    
+#     # Stop processes - send SIGINT (KeyboardInterrupt) so they can save files
+#     for name, proc in recording_processes.items():
+#         if proc and proc.poll() is None:
+#             try:
+#                 if sys.platform == "win32":
+#                     # On Windows, try to send CTRL_C_EVENT (KeyboardInterrupt)
+#                     try:
+#                         proc.send_signal(signal.CTRL_C_EVENT)
+#                     except:
+#                         # If that fails, use terminate
+#                         proc.terminate()
+#                 else:
+#                     # On Unix, send SIGINT (KeyboardInterrupt)
+#                     proc.send_signal(signal.SIGINT)
+#             except Exception as e:
+#                 print(f"Error sending signal to {name}: {e}")
+#                 # Fallback to terminate
+#                 try:
+#                     proc.terminate()
+#                 except:
+#                     pass
+    
+#     # Wait for processes to finish (give them time to process and save)
+#     print("Waiting for processes to finish...")
+#     for name, proc in list(recording_processes.items()):
+#         if proc:
+#             try:
+#                 # Give them time to catch KeyboardInterrupt and process
+#                 proc.wait(timeout=180)  # 3 minutes max
+#                 print(f"{name} finished with code {proc.returncode}")
+#             except subprocess.TimeoutExpired:
+#                 print(f"{name} timed out, killing...")
+#                 proc.kill()
+#                 proc.wait()
+#             except Exception as e:
+#                 print(f"Error waiting for {name}: {e}")
+    
+#     recording_processes = {}
+#     is_recording = False
+    
+#     # Wait for files to be created
+#     update_status("⏳ Processing...", "blue")
+#     root.update()
+    
+#     mic_file = os.path.join(script_dir, "Mic_transcript.txt")
+#     spk_file = os.path.join(script_dir, "Speaker_transcript.txt")
+    
+#     # Wait up to 120 seconds for files (transcription can take time)
+#     print("Waiting for transcript files...")
+#     for i in range(60):  # 60 * 2 = 120 seconds
+#         time.sleep(2)
+#         mic_exists = os.path.exists(mic_file)
+#         spk_exists = os.path.exists(spk_file)
+#         if mic_exists and spk_exists:
+#             print("Both transcript files found!")
+#             break
+#         if i % 5 == 0:  # Print status every 10 seconds
+#             print(f"Waiting... Mic: {mic_exists}, Speaker: {spk_exists}")
+#         root.update()
+    
+#     # Check if files exist
+#     if not os.path.exists(mic_file) or not os.path.exists(spk_file):
+#         missing = []
+#         if not os.path.exists(mic_file):
+#             missing.append("Mic_transcript.txt")
+#         if not os.path.exists(spk_file):
+#             missing.append("Speaker_transcript.txt")
+#         messagebox.showerror(
+#             "Error",
+#             f"Missing files:\n" + "\n".join(missing) + "\n\nCheck if recording captured audio."
+#         )
+#         update_status("❌ Failed", "red")
+#         button.config(text="▶ Start Recording", command=start_recording, state="normal")
+#         return
+    
+#     # Run combined script
+#     update_status("🔄 Merging...", "blue")
+#     root.update()
+    
+#     try:
+#         combined_path = os.path.join(script_dir, SCRIPT_PATHS["combined"])
+#         env = os.environ.copy()
+#         env['PYTHONIOENCODING'] = 'utf-8'
+        
+#         combined_proc = subprocess.Popen(
+#             [sys.executable, combined_path],
+#             stdout=subprocess.PIPE,
+#             stderr=subprocess.PIPE,
+#             text=True,
+#             encoding='utf-8',
+#             errors='replace',
+#             env=env,
+#             cwd=script_dir
+#         )
+        
+#         stdout, stderr = combined_proc.communicate(timeout=300)
+        
+#         if combined_proc.returncode != 0:
+#             print(f"Combined script error: {stderr[:500]}")
+#     except Exception as e:
+#         print(f"Error running combined script: {e}")
+    
+#     # Check results
+#     summary_file = os.path.join(script_dir, "Meeting_summary.txt")
+#     combined_file = os.path.join(script_dir, "Combined_transcript.txt")
+    
+#     if os.path.exists(summary_file) and os.path.exists(combined_file):
+#         update_status("✅ Complete!", "green")
+#         messagebox.showinfo(
+#             "Complete",
+#             "Files created:\n- Combined_transcript.txt\n- Meeting_summary.txt"
+#         )
+#     else:
+#         update_status("⚠️ Partial", "orange")
+#         messagebox.showwarning(
+#             "Warning",
+#             f"Combined: {'✓' if os.path.exists(combined_file) else '✗'}\n"
+#             f"Summary: {'✓' if os.path.exists(summary_file) else '✗'}"
+#         )
+    
+#     button.config(text="▶ Start Recording", command=start_recording, state="normal")
+
+
+# def update_status(text, color="black"):
+#     """Update status label."""
+#     if status_label:
+#         status_label.config(text=text, fg=color)
+
+
+# def monitor_meetings():
+#     """Background thread to monitor for meeting apps."""
+#     meeting_detected = False
+    
+#     while True:
+#         meeting_app = check_meeting_running()
+        
+#         if meeting_app and not meeting_detected:
+#             meeting_detected = True
+#             if root:
+#                 root.after(0, lambda: update_status(f"📹 {meeting_app} detected", "blue"))
+#                 root.after(0, lambda: button.config(state="normal"))
+        
+#         elif not meeting_app and meeting_detected:
+#             meeting_detected = False
+#             if root and not is_recording:
+#                 root.after(0, lambda: update_status("⏸ No meeting", "gray"))
+#                 root.after(0, lambda: button.config(state="disabled"))
+        
+#         time.sleep(2)
+
+
+# def create_gui():
+#     """Create the main GUI window."""
+#     global root, status_label, button
+    
+#     root = tk.Tk()
+#     root.title("OCTI Meeting Recorder")
+#     root.geometry("400x200")
+#     root.resizable(False, False)
+    
+#     # Center window
+#     root.update_idletasks()
+#     x = (root.winfo_screenwidth() // 2) - (400 // 2)
+#     y = (root.winfo_screenheight() // 2) - (200 // 2)
+#     root.geometry(f"400x200+{x}+{y}")
+    
+#     root.attributes("-topmost", True)
+    
+#     # Title
+#     title_label = tk.Label(
+#         root,
+#         text="🎙 OCTI Meeting Recorder",
+#         font=("Arial", 16, "bold"),
+#         pady=20
+#     )
+#     title_label.pack()
+    
+#     # Status label
+#     status_label = tk.Label(
+#         root,
+#         text="🔍 Detecting meetings...",
+#         font=("Arial", 10),
+#         fg="gray",
+#         pady=10
+#     )
+#     status_label.pack()
+    
+#     # Button
+#     button = tk.Button(
+#         root,
+#         text="▶ Start Recording",
+#         font=("Arial", 12, "bold"),
+#         bg="#4CAF50",
+#         fg="white",
+#         activebackground="#45a049",
+#         activeforeground="white",
+#         width=20,
+#         height=2,
+#         state="disabled",
+#         command=start_recording,
+#         cursor="hand2"
+#     )
+#     button.pack(pady=10)
+    
+#     # Start monitoring thread
+#     monitor_thread = threading.Thread(target=monitor_meetings, daemon=True)
+#     monitor_thread.start()
+    
+#     # Handle window close
+#     def on_closing():
+#         if is_recording:
+#             if messagebox.askokcancel("Quit", "Recording in progress. Stop and quit?"):
+#                 stop_recording()
+#                 time.sleep(1)
+#                 root.destroy()
+#         else:
+#             root.destroy()
+    
+#     root.protocol("WM_DELETE_WINDOW", on_closing)
+#     root.mainloop()
+
+
+# if __name__ == "__main__":
+#     try:
+#         import psutil
+#     except ImportError:
+#         print("Error: psutil not installed. Install it with: pip install psutil")
+#         sys.exit(1)
+    
+#     script_dir = os.path.dirname(os.path.abspath(__file__)) or os.getcwd()
+#     missing = [path for path in SCRIPT_PATHS.values() 
+#                if not os.path.exists(os.path.join(script_dir, path))]
+#     if missing:
+#         print(f"Error: Missing scripts: {', '.join(missing)}")
+#         sys.exit(1)
+    
+#     print("Starting OCTI Meeting Launcher...")
+#     create_gui()
+